@@ -96,7 +96,7 @@ class Core:
         if not self.cache:
             raise Exception("Core isn't attached to any cache")
 
-        io = OcfLib.getInstance().ocf_core_new_io_wrapper(self.handle)
+        io = _ocf_core_new_io_wrapper(self.handle)
         return Io.from_pointer(io)
 
     def new_core_io(self):
@@ -168,3 +168,5 @@ lib.ocf_volume_new_io.argtypes = [c_void_p]
 lib.ocf_volume_new_io.restype = c_void_p
 lib.ocf_core_get_volume.argtypes = [c_void_p]
 lib.ocf_core_get_volume.restype = c_void_p
+
+_ocf_core_new_io_wrapper = lib.ocf_core_new_io_wrapper
@@ -72,6 +72,7 @@ class OcfCtx:
 
     def exit(self):
         self.lib.ocf_ctx_exit(self.ctx_handle)
+        self.data.clear_pool()
 
 
 def get_default_ctx(logger):
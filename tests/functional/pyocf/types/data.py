@@ -12,7 +12,6 @@ from ctypes import (
     cast,
     memset,
     c_char_p,
-    string_at,
     Structure,
     c_int,
     memmove,
@@ -57,8 +56,11 @@ class DataOps(Structure):
 
 class Data(SharedOcfObject):
     PAGE_SIZE = 4096
+    POOL_MAX_PAGES = 32
+    POOL_DEPTH = 64
 
     _instances_ = {}
+    _pool_ = {}
 
     _fields_ = [("data", c_void_p)]
 
@@ -67,7 +69,6 @@ class Data(SharedOcfObject):
         self.position = 0
         self.buffer = create_string_buffer(int(self.size))
         self.data = cast(self.buffer, c_void_p)
-        memset(self.data, 0, self.size)
         type(self)._instances_[self.data] = self
         self._as_parameter_ = self.data
 
@@ -92,6 +93,10 @@ class Data(SharedOcfObject):
     def pages(cls, pages: int):
         return cls(pages * Data.PAGE_SIZE)
 
+    @classmethod
+    def clear_pool(cls):
+        Data._pool_.clear()
+
     @classmethod
     def from_bytes(cls, source: bytes):
         d = cls(len(source))
@@ -122,13 +127,27 @@ class Data(SharedOcfObject):
     @staticmethod
     @DataOps.ALLOC
     def _alloc(pages):
-        data = Data.pages(pages)
+        # Called from several OCF threads, so don't test the pool before
+        # popping - another thread may empty it in between
+        try:
+            data = Data._pool_[pages].pop()
+        except (KeyError, IndexError):
+            data = Data.pages(pages)
+        else:
+            data.position = 0
+            memset(data.data, 0, data.size)
+            Data._instances_[data.data] = data
         return data.data
 
     @staticmethod
     @DataOps.FREE
     def _free(data):
-        Data.del_object(data)
+        data = Data._instances_.pop(data)
+        pages = data.size // Data.PAGE_SIZE
+        if pages <= Data.POOL_MAX_PAGES:
+            pool = Data._pool_.setdefault(pages, [])
+            if len(pool) < Data.POOL_DEPTH:
+                pool.append(data)
 
     @staticmethod
     @DataOps.MLOCK
@@ -214,5 +233,5 @@ class Data(SharedOcfObject):
 
     def md5(self):
         m = md5()
-        m.update(string_at(self.data, self.size))
+        m.update(memoryview(self.buffer))
         return m.hexdigest()
@@ -56,9 +56,7 @@ class Io(Structure):
     def from_pointer(cls, ref):
         c = cls.from_address(ref)
         cls._instances_[ref] = c
-        OcfLib.getInstance().ocf_io_set_cmpl_wrapper(
-            byref(c), None, None, c.c_end
-        )
+        _ocf_io_set_cmpl_wrapper(byref(c), None, None, c.c_end)
         return c
 
     @classmethod
@@ -69,10 +67,10 @@ class Io(Structure):
         del type(self)._instances_[cast(byref(self), c_void_p).value]
 
     def put(self):
-        OcfLib.getInstance().ocf_io_put(byref(self))
+        _ocf_io_put(byref(self))
 
     def get(self):
-        OcfLib.getInstance().ocf_io_get(byref(self))
+        _ocf_io_get(byref(self))
 
     @staticmethod
     @END
@@ -99,22 +97,22 @@ class Io(Structure):
         self.del_object()
 
     def submit(self):
-        return OcfLib.getInstance().ocf_core_submit_io_wrapper(byref(self))
+        return _ocf_core_submit_io_wrapper(byref(self))
 
     def configure(
         self, addr: int, length: int, direction: IoDir, io_class: int, flags: int
     ):
-        OcfLib.getInstance().ocf_io_configure_wrapper(
+        _ocf_io_configure_wrapper(
             byref(self), addr, length, direction, io_class, flags
         )
 
     def set_data(self, data: Data):
         self.data = data
-        OcfLib.getInstance().ocf_io_set_data_wrapper(byref(self), data, 0)
+        _ocf_io_set_data_wrapper(byref(self), data, 0)
 
     def set_queue(self, queue: Queue):
         self.queue = queue
-        OcfLib.getInstance().ocf_io_set_queue_wrapper(byref(self), queue.handle)
+        _ocf_io_set_queue_wrapper(byref(self), queue.handle)
 
 
 IoOps.SET_DATA = CFUNCTYPE(c_int, POINTER(Io), c_void_p, c_uint32)
@@ -142,3 +140,11 @@ lib.ocf_io_set_data_wrapper.argtypes = [POINTER(Io), c_void_p, c_uint32]
 lib.ocf_io_set_data_wrapper.restype = c_int
 
 lib.ocf_io_set_queue_wrapper.argtypes = [POINTER(Io), c_void_p]
+
+_ocf_io_get = lib.ocf_io_get
+_ocf_io_put = lib.ocf_io_put
+_ocf_io_set_cmpl_wrapper = lib.ocf_io_set_cmpl_wrapper
+_ocf_io_configure_wrapper = lib.ocf_io_configure_wrapper
+_ocf_io_set_data_wrapper = lib.ocf_io_set_data_wrapper
+_ocf_io_set_queue_wrapper = lib.ocf_io_set_queue_wrapper
+_ocf_core_submit_io_wrapper = lib.ocf_core_submit_io_wrapper
@@ -3,7 +3,7 @@
 # SPDX-License-Identifier: BSD-3-Clause-Clear
 #
 
-from ctypes import c_void_p, CFUNCTYPE, Structure, byref
+from ctypes import c_void_p, c_uint32, CFUNCTYPE, Structure, byref
 from threading import Thread, Condition, Lock
 
 from ..ocf import OcfLib
@@ -29,15 +29,15 @@ class Queue:
     @staticmethod
     def io_queue_run(*, queue: Queue, kick: Condition):
         def wait_predicate():
-            return queue.stop or OcfLib.getInstance().ocf_queue_pending_io(queue)
+            return queue.stop or _ocf_queue_pending_io(queue)
 
         while True:
             with kick:
                 kick.wait_for(wait_predicate)
 
-            queue.owner.lib.ocf_queue_run(queue)
+            _ocf_queue_run(queue)
 
-            if queue.stop and not queue.owner.lib.ocf_queue_pending_io(queue):
+            if queue.stop and not _ocf_queue_pending_io(queue):
                 break
 
     def __init__(self, cache, name, mngt_queue: bool = False):
@@ -88,7 +88,7 @@ class Queue:
         Queue.get_instance(ref).stop()
 
     def kick_sync(self):
-        self.owner.lib.ocf_queue_run(self.handle)
+        _ocf_queue_run(self.handle)
 
     def kick(self):
         with self.kick_condition:
@@ -102,3 +102,12 @@ class Queue:
         self.thread.join()
         if self.mngt_queue:
             self.owner.lib.ocf_queue_put(self)
+
+
+lib = OcfLib.getInstance()
+lib.ocf_queue_run.argtypes = [c_void_p]
+lib.ocf_queue_pending_io.argtypes = [c_void_p]
+lib.ocf_queue_pending_io.restype = c_uint32
+
+_ocf_queue_run = lib.ocf_queue_run
+_ocf_queue_pending_io = lib.ocf_queue_pending_io
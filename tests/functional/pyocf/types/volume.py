@@ -15,11 +15,14 @@ from ctypes import (
     c_int,
     c_uint,
     c_uint64,
+    c_uint8,
+    c_char,
     sizeof,
     cast,
-    string_at,
 )
 from hashlib import md5
+from mmap import mmap, MAP_PRIVATE, MAP_ANONYMOUS
+import logging
 
 from .io import Io, IoOps, IoDir
 from .shared import OcfErrorCode, Uuid
@@ -34,9 +37,9 @@ class VolumeCaps(Structure):
 
 class VolumeOps(Structure):
     SUBMIT_IO = CFUNCTYPE(None, POINTER(Io))
-    SUBMIT_FLUSH = CFUNCTYPE(None, c_void_p)
+    SUBMIT_FLUSH = CFUNCTYPE(None, POINTER(Io))
     SUBMIT_METADATA = CFUNCTYPE(None, c_void_p)
-    SUBMIT_DISCARD = CFUNCTYPE(None, c_void_p)
+    SUBMIT_DISCARD = CFUNCTYPE(None, POINTER(Io))
     SUBMIT_WRITE_ZEROES = CFUNCTYPE(None, c_void_p)
     OPEN = CFUNCTYPE(c_int, c_void_p)
     CLOSE = CFUNCTYPE(None, c_void_p)
@@ -68,13 +71,18 @@ class VolumeProperties(Structure):
 
 
 class VolumeIoPriv(Structure):
-    _fields_ = [("_data", c_void_p)]
+    _fields_ = [("_data", c_void_p), ("_offset", c_uint64)]
 
 
 class Volume(Structure):
+    MMAP_THRESHOLD = 1024 * 1024
+
     _fields_ = [("_storage", c_void_p)]
     _instances_ = {}
     _uuid_ = {}
+    _unallocated_uuids_ = set()
+    _ops_ = None
+    _io_ops_ = None
 
     def __init__(self, size: S, uuid=None):
         super().__init__()
@@ -90,11 +98,45 @@ class Volume(Structure):
 
         type(self)._uuid_[self.uuid] = self
 
-        self.data = create_string_buffer(int(self.size))
+        if int(self.size) >= self.MMAP_THRESHOLD:
+            # Private anonymous mapping is backed by demand-zero pages, so
+            # large volumes don't have their whole storage zeroed up front
+            self._mmap = mmap(
+                -1, int(self.size), flags=MAP_PRIVATE | MAP_ANONYMOUS
+            )
+            self.data = (c_char * int(self.size)).from_buffer(self._mmap)
+        else:
+            self.data = create_string_buffer(int(self.size))
         self._storage = cast(self.data, c_void_p)
         self.reset_stats()
         self.opened = False
 
+    @classmethod
+    def get_ops(cls):
+        if Volume._ops_ is None:
+            Volume._ops_ = VolumeOps(
+                _submit_io=Volume._submit_io,
+                _submit_flush=Volume._submit_flush,
+                _submit_metadata=Volume._submit_metadata,
+                _submit_discard=Volume._submit_discard,
+                _submit_write_zeroes=Volume._submit_write_zeroes,
+                _open=Volume._open,
+                _close=Volume._close,
+                _get_max_io_size=Volume._get_max_io_size,
+                _get_length=Volume._get_length,
+            )
+
+        return Volume._ops_
+
+    @classmethod
+    def get_io_ops(cls):
+        if Volume._io_ops_ is None:
+            Volume._io_ops_ = IoOps(
+                _set_data=Volume._io_set_data, _get_data=Volume._io_get_data
+            )
+
+        return Volume._io_ops_
+
     @classmethod
     def get_props(cls):
         return VolumeProperties(
@@ -102,18 +144,8 @@ class Volume(Structure):
             _io_priv_size=sizeof(VolumeIoPriv),
             _volume_priv_size=0,
             _caps=VolumeCaps(_atomic_writes=0),
-            _ops=VolumeOps(
-                _submit_io=cls._submit_io,
-                _submit_flush=cls._submit_flush,
-                _submit_metadata=cls._submit_metadata,
-                _submit_discard=cls._submit_discard,
-                _submit_write_zeroes=cls._submit_write_zeroes,
-                _open=cls._open,
-                _close=cls._close,
-                _get_max_io_size=cls._get_max_io_size,
-                _get_length=cls._get_length,
-            ),
-            _io_ops=IoOps(_set_data=cls._io_set_data, _get_data=cls._io_get_data),
+            _ops=cls.get_ops(),
+            _io_ops=cls.get_io_ops(),
         )
 
     @classmethod
@@ -127,18 +159,16 @@ class Volume(Structure):
     @staticmethod
     @VolumeOps.SUBMIT_IO
     def _submit_io(io):
-        io_structure = cast(io, POINTER(Io))
-        volume = Volume.get_instance(io_structure.contents._volume)
+        volume = Volume._instances_[io.contents._volume]
 
-        volume.submit_io(io_structure)
+        volume.submit_io(io)
 
     @staticmethod
     @VolumeOps.SUBMIT_FLUSH
     def _submit_flush(flush):
-        io_structure = cast(flush, POINTER(Io))
-        volume = Volume.get_instance(io_structure.contents._volume)
+        volume = Volume._instances_[flush.contents._volume]
 
-        volume.submit_flush(io_structure)
+        volume.submit_flush(flush)
 
     @staticmethod
     @VolumeOps.SUBMIT_METADATA
@@ -148,10 +178,9 @@ class Volume(Structure):
     @staticmethod
     @VolumeOps.SUBMIT_DISCARD
     def _submit_discard(discard):
-        io_structure = cast(discard, POINTER(Io))
-        volume = Volume.get_instance(io_structure.contents._volume)
+        volume = Volume._instances_[discard.contents._volume]
 
-        volume.submit_discard(io_structure)
+        volume.submit_discard(discard)
 
     @staticmethod
     @VolumeOps.SUBMIT_WRITE_ZEROES
@@ -161,15 +190,18 @@ class Volume(Structure):
     @staticmethod
     @CFUNCTYPE(c_int, c_void_p)
     def _open(ref):
-        uuid_ptr = cast(
-            OcfLib.getInstance().ocf_volume_get_uuid(ref), POINTER(Uuid)
-        )
+        uuid_ptr = cast(_ocf_volume_get_uuid(ref), POINTER(Uuid))
         uuid = str(uuid_ptr.contents._data, encoding="ascii")
         try:
             volume = Volume.get_by_uuid(uuid)
         except:
-            print("Tried to access unallocated volume {}".format(uuid))
-            print("{}".format(Volume._uuid_))
+            if uuid not in Volume._unallocated_uuids_:
+                Volume._unallocated_uuids_.add(uuid)
+                logging.getLogger("pyocf").warning(
+                    "Tried to access unallocated volume {} (allocated: {})".format(
+                        uuid, list(Volume._uuid_)
+                    )
+                )
             return -1
 
         type(volume)._instances_[ref] = volume
@@ -195,20 +227,17 @@ class Volume(Structure):
     @staticmethod
     @IoOps.SET_DATA
     def _io_set_data(io, data, offset):
-        io_priv = cast(
-            OcfLib.getInstance().ocf_io_get_priv(io), POINTER(VolumeIoPriv)
-        )
+        io_priv = _ocf_io_get_priv(io)
         data = Data.get_instance(data)
         data.position = offset
         io_priv.contents._data = data.data
+        io_priv.contents._offset = offset
         return 0
 
     @staticmethod
     @IoOps.GET_DATA
     def _io_get_data(io):
-        io_priv = cast(
-            OcfLib.getInstance().ocf_io_get_priv(io), POINTER(VolumeIoPriv)
-        )
+        io_priv = _ocf_io_get_priv(io)
         return io_priv.contents._data
 
     def open(self):
@@ -234,28 +263,38 @@ class Volume(Structure):
         discard.contents._end(discard, 0)
 
     def get_stats(self):
-        return self.stats
+        return {
+            IoDir.WRITE: self.stats[IoDir.WRITE],
+            IoDir.READ: self.stats[IoDir.READ],
+        }
 
     def reset_stats(self):
-        self.stats = {IoDir.WRITE: 0, IoDir.READ: 0}
+        # Indexed by raw IO direction value, see IoDir
+        self.stats = [0, 0]
 
     def submit_io(self, io):
-        try:
-            self.stats[IoDir(io.contents._dir)] += 1
-            if io.contents._dir == IoDir.WRITE:
-                src_ptr = cast(io.contents._ops.contents._get_data(io), c_void_p)
-                src = Data.get_instance(src_ptr.value)
-                dst = self._storage + io.contents._addr
-            elif io.contents._dir == IoDir.READ:
-                dst_ptr = cast(io.contents._ops.contents._get_data(io), c_void_p)
-                dst = Data.get_instance(dst_ptr.value)
-                src = self._storage + io.contents._addr
-
-            memmove(dst, src, io.contents._bytes)
-
-            io.contents._end(io, 0)
-        except:
-            io.contents._end(io, -5)
+        io_structure = io.contents
+        addr = io_structure._addr
+        nbytes = io_structure._bytes
+        direction = io_structure._dir
+        io_priv = _ocf_io_get_priv(io).contents
+        if (
+            direction not in (IoDir.READ, IoDir.WRITE)
+            or io_priv._data is None
+            or addr + nbytes > len(self.data)
+        ):
+            io_structure._end(io, -5)
+            return
+
+        self.stats[direction] += 1
+        data = io_priv._data + io_priv._offset
+        storage = self._storage + addr
+        if direction == IoDir.WRITE:
+            memmove(storage, data, nbytes)
+        else:
+            memmove(data, storage, nbytes)
+
+        io_structure._end(io, 0)
 
     def dump_contents(self, stop_after_zeros=0, offset=0, size=0):
         if size == 0:
@@ -266,29 +305,56 @@ class Volume(Structure):
 
     def md5(self):
         m = md5()
-        m.update(string_at(self._storage, self.size))
+        m.update(memoryview(self.data))
         return m.hexdigest()
 
 
 class ErrorDevice(Volume):
     def __init__(self, size, error_sectors: set = None, uuid=None):
         super().__init__(size, uuid)
-        self.error_sectors = error_sectors or set()
+        self.set_mapping(error_sectors or set())
 
     def set_mapping(self, error_sectors: set):
+        if not isinstance(error_sectors, (set, frozenset)):
+            error_sectors = set(error_sectors)
         self.error_sectors = error_sectors
 
     def submit_io(self, io):
-        if io.contents._addr in self.error_sectors:
-            io.contents._end(io, -5)
-            self.stats["errors"][io.contents._dir] += 1
+        io_structure = io.contents
+        if io_structure._addr in self.error_sectors:
+            io_structure._end(io, -5)
+            self.error_stats[io_structure._dir] += 1
         else:
             super().submit_io(io)
 
+    def get_stats(self):
+        stats = super().get_stats()
+        stats["errors"] = {
+            IoDir.WRITE: self.error_stats[IoDir.WRITE],
+            IoDir.READ: self.error_stats[IoDir.READ],
+        }
+        return stats
+
     def reset_stats(self):
         super().reset_stats()
-        self.stats["errors"] = {IoDir.WRITE: 0, IoDir.READ: 0}
+        self.error_stats = [0, 0]
 
 
 lib = OcfLib.getInstance()
+lib.ocf_io_get_priv.argtypes = [POINTER(Io)]
 lib.ocf_io_get_priv.restype = POINTER(VolumeIoPriv)
+lib.ocf_ctx_volume_create.argtypes = [
+    c_void_p,
+    POINTER(c_void_p),
+    POINTER(Uuid),
+    c_uint8,
+]
+lib.ocf_volume_open.argtypes = [c_void_p, c_void_p]
+lib.ocf_volume_close.argtypes = [c_void_p]
+lib.ocf_volume_destroy.argtypes = [c_void_p]
+lib.ocf_volume_new_io.argtypes = [c_void_p]
+lib.ocf_volume_new_io.restype = c_void_p
+lib.ocf_volume_submit_io.argtypes = [POINTER(Io)]
+
+_ocf_io_get_priv = lib.ocf_io_get_priv
+_ocf_volume_get_uuid = lib.ocf_volume_get_uuid
@@ -4,6 +4,9 @@
 #
 
 from ctypes import string_at
+import re
+
+_NON_ZERO_BYTE = re.compile(rb"[^\x00]")
 
 
 def print_buffer(buf, length, offset=0, width=16, stop_after_zeros=0):
@@ -13,20 +16,29 @@ def print_buffer(buf, length, offset=0, width=16, stop_after_zeros=0):
     whole_buffer_empty = True
     stop_after_zeros = int(stop_after_zeros / width)
 
-    for addr in range(offset, end, width):
+    addr = offset
+    while addr < end:
         cur_line = buf[addr : min(end, addr + width)]
         all_zeros = True
         byteline = ""
         asciiline = ""
         if not any(cur_line):
-            if stop_after_zeros and zero_lines > stop_after_zeros:
+            # Skip the whole run of empty lines in one regex scan instead of
+            # testing them line by line
+            non_zero = _NON_ZERO_BYTE.search(buf, addr, end)
+            if non_zero:
+                run = (non_zero.start() - addr) // width
+            else:
+                run = -(-(end - addr) // width)
+            if stop_after_zeros and zero_lines + run > stop_after_zeros + 1:
                 print(
                     "<{} bytes of empty space encountered, stopping>".format(
                         stop_after_zeros * width
                     )
                 )
                 return
-            zero_lines += 1
+            zero_lines += run
+            addr += run * width
             continue
 
         if zero_lines:
@@ -44,6 +56,7 @@ def print_buffer(buf, length, offset=0, width=16, stop_after_zeros=0):
 
         print("{:#08X}\t{}\t{}".format(addr, byteline, asciiline))
         whole_buffer_empty = False
+        addr += width
 
     if whole_buffer_empty:
         print("<whole buffer empty>")
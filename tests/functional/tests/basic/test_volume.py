@@ -0,0 +1,93 @@
+#
+# Copyright(c) 2019 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause-Clear
+#
+
+from ctypes import c_int, c_void_p, c_char_p, byref, cast, create_string_buffer
+
+from pyocf.types.volume import Volume
+from pyocf.types.data import Data
+from pyocf.types.io import Io, IoDir
+from pyocf.types.shared import OcfCompletion, Uuid
+from pyocf.utils import Size as S
+from pyocf.ocf import OcfLib
+
+
+def open_volume(ctx, volume):
+    lib = OcfLib.getInstance()
+    uuid_data = create_string_buffer(volume.uuid.encode("ascii"))
+    uuid = Uuid(_data=cast(uuid_data, c_char_p), _size=len(volume.uuid) + 1)
+    handle = c_void_p()
+
+    assert (
+        lib.ocf_ctx_volume_create(
+            ctx.ctx_handle, byref(handle), byref(uuid), type(volume).type_id
+        )
+        == 0
+    )
+    assert lib.ocf_volume_open(handle, None) == 0
+
+    return handle
+
+
+def close_volume(handle):
+    lib = OcfLib.getInstance()
+    lib.ocf_volume_close(handle)
+    lib.ocf_volume_destroy(handle)
+
+
+def submit_volume_io(handle, addr, length, direction, data, offset=0):
+    lib = OcfLib.getInstance()
+    io = Io.from_pointer(lib.ocf_volume_new_io(handle))
+    io.configure(addr, length, direction, 0, 0)
+    io.data = data
+    lib.ocf_io_set_data_wrapper(byref(io), data, offset)
+
+    cmpl = OcfCompletion([("err", c_int)])
+    io.callback = cmpl.callback
+    lib.ocf_volume_submit_io(byref(io))
+    cmpl.wait()
+
+    return cmpl.results["err"]
+
+
+def test_io_data_offset(pyocf_ctx):
+    volume = Volume(S.from_KiB(8))
+    handle = open_volume(pyocf_ctx, volume)
+
+    write_data = Data.from_string("xxxxThis is test data")
+    assert submit_volume_io(handle, 512, 17, IoDir.WRITE, write_data, 4) == 0
+    assert bytes(volume.data[512:529]) == b"This is test data"
+
+    read_data = Data(32)
+    assert submit_volume_io(handle, 512, 17, IoDir.READ, read_data, 8) == 0
+    assert bytes(read_data.buffer[0:8]) == bytes(8)
+    assert bytes(read_data.buffer[8:25]) == b"This is test data"
+
+    close_volume(handle)
+
+
+def test_io_stats(pyocf_ctx):
+    volume = Volume(S.from_KiB(8))
+    handle = open_volume(pyocf_ctx, volume)
+
+    data = Data(512)
+    assert submit_volume_io(handle, 0, 512, IoDir.WRITE, data) == 0
+    assert submit_volume_io(handle, 0, 512, IoDir.WRITE, data) == 0
+    assert submit_volume_io(handle, 512, 512, IoDir.READ, data) == 0
+    assert volume.get_stats() == {IoDir.WRITE: 2, IoDir.READ: 1}
+
+    close_volume(handle)
+
+
+def test_io_past_end(pyocf_ctx):
+    volume = Volume(S.from_KiB(8))
+    handle = open_volume(pyocf_ctx, volume)
+
+    data = Data.from_bytes(b"\xff" * 1024)
+    assert submit_volume_io(handle, 7680, 1024, IoDir.WRITE, data) == -5
+    assert submit_volume_io(handle, 7680, 1024, IoDir.READ, data) == -5
+    assert volume.get_stats() == {IoDir.WRITE: 0, IoDir.READ: 0}
+    assert bytes(volume.data[7680:8192]) == bytes(512)
+
+    close_volume(handle)